@@ -8,6 +8,13 @@ interface AIAssistantProps {
   isProcessing: boolean;
 }
 
+const SUGGESTIONS = [
+  "Make it cinematic",
+  "Slow down the video",
+  "Increase volume",
+  "Analyze the mood"
+];
+
 const AIAssistant: React.FC<AIAssistantProps> = ({ messages, onSendMessage, isProcessing }) => {
   const [input, setInput] = useState('');
   const scrollRef = useRef<HTMLDivElement>(null);
@@ -32,13 +39,6 @@ const AIAssistant: React.FC<AIAssistantProps> = ({ messages, onSendMessage, isPr
     }
   };
 
-  const suggestions = [
-    "Make it cinematic",
-    "Slow down the video",
-    "Increase volume",
-    "Analyze the mood"
-  ];
-
   return (
     <div className="flex flex-col h-full bg-dark-surface border-r border-dark-border w-80">
       <div className="p-4 border-b border-dark-border flex items-center gap-2">
@@ -89,7 +89,7 @@ const AIAssistant: React.FC<AIAssistantProps> = ({ messages, onSendMessage, isPr
       {/* Quick Suggestions */}
       {messages.length < 3 && !isProcessing && (
           <div className="px-4 pb-2 flex gap-2 overflow-x-auto no-scrollbar">
-              {suggestions.map((s, i) => (
+              {SUGGESTIONS.map((s, i) => (
                   <button 
                     key={i} 
                     onClick={() => onSendMessage(s)}
@@ -8,18 +8,21 @@ interface ControlPanelProps {
   onCommit: () => void;
 }
 
+const FILTERS: { id: FilterType; name: string }[] = [
+  { id: 'none', name: 'Normal' },
+  { id: 'grayscale', name: 'B&W' },
+  { id: 'sepia', name: 'Sepia' },
+  { id: 'vintage', name: 'Vintage' },
+  { id: 'cyberpunk', name: 'Cyber' },
+  { id: 'warm', name: 'Warm' },
+];
+
+// Set lookup instead of scanning the filter list on every render
+const FILTER_IDS = new Set<string>(FILTERS.map(f => f.id));
+
 const ControlPanel: React.FC<ControlPanelProps> = ({ state, onUpdate, onCommit }) => {
-  
-  const filters: { id: FilterType; name: string }[] = [
-    { id: 'none', name: 'Normal' },
-    { id: 'grayscale', name: 'B&W' },
-    { id: 'sepia', name: 'Sepia' },
-    { id: 'vintage', name: 'Vintage' },
-    { id: 'cyberpunk', name: 'Cyber' },
-    { id: 'warm', name: 'Warm' },
-  ];
-  
-  const isCustomFilter = !filters.some(f => f.id === state.filter);
+
+  const isCustomFilter = !FILTER_IDS.has(state.filter);
 
   return (
     <div className="w-80 bg-dark-surface border-l border-dark-border p-4 overflow-y-auto flex flex-col gap-6">
@@ -157,7 +160,7 @@ const ControlPanel: React.FC<ControlPanelProps> = ({ state, onUpdate, onCommit }
                 )}
             </div>
             <div className="grid grid-cols-2 gap-2">
-                {filters.map((f) => (
+                {FILTERS.map((f) => (
                     <button
                         key={f.id}
                         onClick={() => onUpdate({ filter: f.id }, true)}
@@ -1,7 +1,7 @@
 import React, { useEffect, useState } from 'react';
 import { Project, UserProfile } from '../types';
 import { createProject, getUserProjects, deleteProject } from '../services/db';
-import { deleteVideoFromLocal } from '../services/localStore';
+import { deleteFileFromLocal } from '../services/localStore';
 import { Plus, Video, Calendar, Trash2, LogOut, Loader2, ShieldAlert, RefreshCw, AlertTriangle, ExternalLink, Hourglass } from 'lucide-react';
 import { auth } from '../firebaseConfig';
 
@@ -196,9 +196,10 @@ service cloud.firestore {
     setCreating(true);
     const name = `Untitled Project ${projects.length + 1}`;
     try {
-        await createProject(user.uid, name);
-        // Refresh list
-        await loadProjects();
+        const project = await createProject(user.uid, name);
+        // Prepend locally — the new project is the most recently modified,
+        // so there is no need to refetch the whole collection for one insert.
+        setProjects(prev => [project, ...prev]);
     } catch (e: any) {
         console.error(e);
         if (e.code === 'permission-denied') {
@@ -211,14 +212,17 @@ service cloud.firestore {
     }
   };
 
-  const handleDelete = async (e: React.MouseEvent, id: string) => {
+  const handleDelete = async (e: React.MouseEvent, project: Project) => {
       e.stopPropagation();
       if(confirm('Are you sure you want to delete this project?')) {
           try {
-            await deleteProject(id);
-            // Also cleanup local video file to free up space
-            await deleteVideoFromLocal(id);
-            setProjects(prev => prev.filter(p => p.id !== id));
+            await deleteProject(project.id);
+            // Also cleanup local media to free up space. Files are keyed by
+            // clip id, so delete exactly those known keys.
+            await Promise.all(
+                (project.clips || []).map(clip => deleteFileFromLocal(clip.id).catch(() => {}))
+            );
+            setProjects(prev => prev.filter(p => p.id !== project.id));
           } catch (err: any) {
               alert("Failed to delete: " + err.message);
           }
@@ -298,7 +302,7 @@ service cloud.firestore {
                                 <div className="flex items-start justify-between">
                                     <h3 className="font-medium text-white group-hover:text-lumina-400 transition-colors truncate pr-4">{project.name}</h3>
                                     <button 
-                                        onClick={(e) => handleDelete(e, project.id)}
+                                        onClick={(e) => handleDelete(e, project)}
                                         className="text-gray-500 hover:text-red-400 transition-colors p-1"
                                     >
                                         <Trash2 size={16} />
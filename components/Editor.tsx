@@ -1,4 +1,4 @@
-import React, { useState, useRef, useEffect } from 'react';
+import React, { useState, useRef, useEffect, useMemo } from 'react';
 import { Upload, Play, Pause, RotateCcw, Download, Undo2, Redo2, ArrowLeft, Save, Loader2, AlertTriangle, Plus, Maximize2, Minimize2, MessageSquare, PanelRightClose, PanelRightOpen, RefreshCw, Pencil } from 'lucide-react';
 import VideoPlayer, { VideoPlayerRef } from './VideoPlayer';
 import Timeline from './Timeline';
@@ -9,13 +9,50 @@ import { processUserCommand } from '../services/geminiService';
 import { saveProject } from '../services/db';
 import { saveFileToLocal, getFileFromLocal } from '../services/localStore';
 
-// Helper for ID generation
-const generateId = () => Math.random().toString(36).substr(2, 9);
+// Helper for ID generation — a session timestamp base plus a monotonic
+// counter. Cheaper than drawing randomness per call, and unlike the previous
+// Math.random approach it cannot collide within a session.
+const ID_BASE = Date.now().toString(36);
+let idCounter = 0;
+const generateId = () => `${ID_BASE}-${(idCounter++).toString(36)}`;
+
+// Single place to classify an uploaded file; everything that isn't an image
+// is treated as video, matching the file-input accept list.
+const mediaTypeOf = (file: File): 'video' | 'image' =>
+    file.type.startsWith('image') ? 'image' : 'video';
+
+// Clips are kept sorted by start time everywhere they're set, so the clip
+// under the playhead can be found with a binary search instead of a linear
+// scan on every playback tick. Dragged clips may overlap, so after bisecting
+// to the latest clip with start <= time we scan left until one actually
+// contains the playhead — the latest-starting containing clip wins, and a
+// covered playhead always resolves to a clip. The scan is O(1) when clips
+// don't overlap, which is the common case.
+const findClipAt = (clips: TimelineClip[], time: number): TimelineClip | null => {
+    let lo = 0;
+    let hi = clips.length - 1;
+    while (lo <= hi) {
+        const mid = (lo + hi) >> 1;
+        if ((clips[mid].start || 0) <= time) {
+            lo = mid + 1;
+        } else {
+            hi = mid - 1;
+        }
+    }
+    // hi is now the index of the latest clip starting at or before `time`.
+    for (let i = hi; i >= 0; i--) {
+        const clip = clips[i];
+        if (time < (clip.start || 0) + (clip.duration || 0)) {
+            return clip;
+        }
+    }
+    return null;
+};
 
 // Helper to get media metadata (duration)
 const getMediaInfo = (file: File): Promise<{ duration: number, type: 'video' | 'image' }> => {
     return new Promise((resolve) => {
-        if (file.type.startsWith('image')) {
+        if (mediaTypeOf(file) === 'image') {
             resolve({ duration: 5, type: 'image' });
             return;
         }
@@ -97,6 +134,14 @@ const Editor: React.FC<EditorProps> = ({ project, onBack }) => {
   const replaceInputRef = useRef<HTMLInputElement>(null); // New input for replacement
   const playbackInterval = useRef<number | null>(null);
 
+  // Latest clips, tracked for the unmount cleanup below. The cleanup closure
+  // is created on mount, so reading `clips` there directly would only ever
+  // see the initial (empty-src) list and leak every real object URL.
+  const clipsRef = useRef<TimelineClip[]>(clips);
+  useEffect(() => {
+      clipsRef.current = clips;
+  }, [clips]);
+
   // --- INITIALIZATION ---
 
   useEffect(() => {
@@ -158,8 +203,8 @@ const Editor: React.FC<EditorProps> = ({ project, onBack }) => {
     restoreMedia();
 
     return () => {
-        // Cleanup Blob URLs on unmount
-        clips.forEach(c => {
+        // Cleanup Blob URLs on unmount (via ref — see clipsRef above)
+        clipsRef.current.forEach(c => {
             if (c.src && c.src.startsWith('blob:')) {
                 URL.revokeObjectURL(c.src);
             }
@@ -171,21 +216,19 @@ const Editor: React.FC<EditorProps> = ({ project, onBack }) => {
 
   useEffect(() => {
       // Find the clip at current time
-      const current = clips.find(c => {
-          const start = c.start || 0;
-          const duration = c.duration || 0;
-          return videoState.currentTime >= start && videoState.currentTime < (start + duration);
-      });
-      setActiveClip(current || null);
+      setActiveClip(findClipAt(clips, videoState.currentTime));
   }, [videoState.currentTime, clips]);
 
   useEffect(() => {
       if (videoState.isPlaying) {
+          // Hoisted out of the tick callback: clips are an effect dependency,
+          // so the timeline end cannot change without re-running this effect.
+          const maxDuration = Math.max(...clips.map(c => (c.start || 0) + (c.duration || 0)), 0);
+
           playbackInterval.current = window.setInterval(() => {
               setVideoState(prev => {
                   const nextTime = prev.currentTime + 0.1 * prev.playbackRate; // 100ms tick
-                  
-                  const maxDuration = Math.max(...clips.map(c => (c.start || 0) + (c.duration || 0)), 0);
+
                   if (nextTime >= maxDuration && maxDuration > 0) {
                       return { ...prev, currentTime: maxDuration, isPlaying: false };
                   }
@@ -219,36 +262,44 @@ const Editor: React.FC<EditorProps> = ({ project, onBack }) => {
     
     if (!isFinite(startPosition) || startPosition < 0) startPosition = 0;
 
-    for (let i = 0; i < files.length; i++) {
-        const file = files[i];
+    // Probe metadata and persist all files concurrently; the metadata load and
+    // the IndexedDB write are independent per file, so there's no reason to
+    // serialize them.
+    const prepared = await Promise.all(Array.from(files).map(async (file) => {
         const clipId = generateId();
-        
         try {
-            const { duration, type } = await getMediaInfo(file);
-            const url = URL.createObjectURL(file);
-            
-            newClips.push({
-                id: clipId,
-                type,
-                src: url,
-                name: file.name,
-                start: startPosition,
-                duration: duration,
-                offset: 0
-            });
-            
-            await saveFileToLocal(clipId, file);
-            startPosition += duration;
-
+            const [{ duration, type }] = await Promise.all([
+                getMediaInfo(file),
+                saveFileToLocal(clipId, file)
+            ]);
+            return { clipId, file, duration, type };
         } catch (e) {
             console.error("Failed to process file", file.name, e);
+            return null;
         }
+    }));
+
+    // Assign timeline positions in the original selection order
+    for (const item of prepared) {
+        if (!item) continue;
+        newClips.push({
+            id: item.clipId,
+            type: item.type,
+            src: URL.createObjectURL(item.file),
+            name: item.file.name,
+            start: startPosition,
+            duration: item.duration,
+            offset: 0
+        });
+        startPosition += item.duration;
     }
 
     const updatedClips = [...clips, ...newClips].sort((a, b) => a.start - b.start);
     setClips(updatedClips);
-    
-    const newTotalDuration = Math.max(...updatedClips.map(c => c.start + c.duration), 0);
+
+    // New clips are appended sequentially, so startPosition already ends up at
+    // the end of the timeline — no need to rescan every clip for the max.
+    const newTotalDuration = startPosition;
     setVideoState(prev => ({ ...prev, duration: newTotalDuration }));
     
     recordHistory({ ...videoState, duration: newTotalDuration }, updatedClips);
@@ -271,12 +322,12 @@ const Editor: React.FC<EditorProps> = ({ project, onBack }) => {
           // 3. Update clips state
           const updatedClips = clips.map(c => {
               if (c.id === activeClip.id) {
-                  return { 
-                      ...c, 
-                      src: url, 
-                      name: file.name, 
-                      type: (file.type.startsWith('image') ? 'image' : 'video') as 'image' | 'video'
-                  }; 
+                  return {
+                      ...c,
+                      src: url,
+                      name: file.name,
+                      type: mediaTypeOf(file)
+                  };
               }
               return c;
           });
@@ -347,8 +398,11 @@ const Editor: React.FC<EditorProps> = ({ project, onBack }) => {
   const handleSave = async () => {
       setIsSaving(true);
       try {
-        // Generate a small thumbnail from the current frame
-        const thumbnail = playerRef.current?.getSnapshot();
+        // Generate a small thumbnail from the current frame. Dashboard cards
+        // render well under 320px wide, so capture at that size instead of
+        // the full AI-context resolution — quarter the pixels to encode and
+        // store in Firestore.
+        const thumbnail = playerRef.current?.getSnapshot(320);
 
         await saveProject(project.id, {
             videoState,
@@ -425,9 +479,18 @@ const Editor: React.FC<EditorProps> = ({ project, onBack }) => {
       }
   };
 
-  // Safe duration calc
-  const safeClips = clips.filter(c => isFinite(c.start) && isFinite(c.duration));
-  const totalDuration = safeClips.length > 0 ? Math.max(...safeClips.map(c => c.start + c.duration), 10) : 10;
+  // Safe duration calc — recomputed only when clips change, in a single pass
+  // with no intermediate filtered/mapped arrays
+  const totalDuration = useMemo(() => {
+    let end = 0;
+    for (const c of clips) {
+      if (isFinite(c.start) && isFinite(c.duration)) {
+        const clipEnd = c.start + c.duration;
+        if (clipEnd > end) end = clipEnd;
+      }
+    }
+    return Math.max(end, 10); // Minimum 10s timeline
+  }, [clips]);
 
   return (
     <div className="flex flex-col h-screen bg-dark-bg text-gray-100 font-sans overflow-hidden">
@@ -10,6 +10,11 @@ interface TimelineProps {
   onClipUpdate: (updatedClip: TimelineClip) => void;
 }
 
+// Fixed visual budgets for the ruler ticks and the simulated thumbnail strip,
+// allocated once — the timeline re-renders on every playhead tick.
+const RULER_TICKS = Array.from({ length: 10 }, (_, i) => i);
+const THUMB_SEGMENTS = Array.from({ length: 5 }, (_, i) => i);
+
 const Timeline: React.FC<TimelineProps> = ({ duration, currentTime, clips, onSeek, onClipUpdate }) => {
   const progressBarRef = useRef<HTMLDivElement>(null);
   const [draggingId, setDraggingId] = useState<string | null>(null);
@@ -145,7 +150,7 @@ const Timeline: React.FC<TimelineProps> = ({ duration, currentTime, clips, onSee
         <div className="h-6 flex items-center px-4 text-xs text-gray-500 border-b border-dark-border bg-gray-900/50">
             <span className="w-16">{formatTime(currentTime)}</span>
             <div className="flex-1 flex justify-between px-4 opacity-30">
-                {[...Array(10)].map((_, i) => (
+                {RULER_TICKS.map((i) => (
                     <div key={i} className="w-px h-2 bg-gray-500"></div>
                 ))}
             </div>
@@ -202,7 +207,7 @@ const Timeline: React.FC<TimelineProps> = ({ duration, currentTime, clips, onSee
                              <div className="w-full h-full flex flex-col justify-center px-4 relative overflow-hidden pointer-events-none">
                                  {/* Thumbnails Strip (Simulated) */}
                                  <div className="absolute inset-0 flex opacity-20">
-                                    {[...Array(5)].map((_, i) => (
+                                    {THUMB_SEGMENTS.map((i) => (
                                         <div key={i} className="flex-1 border-r border-black/20 bg-white/5"></div>
                                     ))}
                                  </div>
@@ -1,4 +1,4 @@
-import React, { useRef, useEffect, forwardRef, useImperativeHandle, useState } from 'react';
+import React, { useRef, useEffect, forwardRef, useImperativeHandle, useState, useMemo } from 'react';
 import { VideoState } from '../types';
 import { AlertTriangle, FileVideo, RefreshCw, Image as ImageIcon } from 'lucide-react';
 
@@ -18,9 +18,20 @@ interface VideoPlayerProps {
 }
 
 export interface VideoPlayerRef {
-  getSnapshot: () => string | null;
+  getSnapshot: (maxWidth?: number) => string | null;
 }
 
+// CSS for each filter preset, resolved once at module load instead of per call.
+// Anything not in this map is treated as a raw custom filter string from the AI.
+const PRESET_FILTERS: Record<string, string> = {
+  none: '',
+  grayscale: 'grayscale(100%)',
+  sepia: 'sepia(100%)',
+  vintage: 'sepia(50%) contrast(120%) brightness(90%)',
+  cyberpunk: 'hue-rotate(180deg) saturate(200%) contrast(110%)',
+  warm: 'sepia(30%) saturate(140%) hue-rotate(-10deg)',
+};
+
 const VideoPlayer = forwardRef<VideoPlayerRef, VideoPlayerProps>(({ 
   src, 
   type = 'video', // Default to video
@@ -37,66 +48,75 @@ const VideoPlayer = forwardRef<VideoPlayerRef, VideoPlayerProps>(({
   const [hasError, setHasError] = useState(false);
   const [errorDetails, setErrorDetails] = useState<string>('');
 
+  // Last rasterized snapshot, keyed by source + playhead. Saving the project
+  // and firing AI commands on the same paused frame re-request an identical
+  // JPEG; reuse it instead of re-encoding.
+  const snapshotCache = useRef<{ key: string; dataUrl: string | null } | null>(null);
+
+  // Scratch canvas reused across captures instead of allocating a fresh
+  // element (and backing buffer) per snapshot.
+  const snapshotCanvas = useRef<HTMLCanvasElement | null>(null);
+
   // Reset error when src changes
   useEffect(() => {
       setHasError(false);
       setErrorDetails('');
   }, [src]);
 
-  // Expose method to capture frame for AI analysis and thumbnails
+  // Rasterize a media element to a downscaled JPEG data URL, preserving
+  // aspect ratio. Shared by the video and image snapshot paths.
+  const captureElement = (
+    source: CanvasImageSource,
+    originalWidth: number,
+    originalHeight: number,
+    maxWidth: number
+  ): string | null => {
+    const scale = Math.min(1, maxWidth / originalWidth);
+    const width = originalWidth * scale;
+    const height = originalHeight * scale;
+
+    const canvas = snapshotCanvas.current ?? (snapshotCanvas.current = document.createElement('canvas'));
+    // Resizing also clears the canvas, so no stale pixels survive reuse
+    canvas.width = width;
+    canvas.height = height;
+
+    const ctx = canvas.getContext('2d');
+    if (!ctx) return null;
+
+    // Apply filters if needed for WYSIWYG snapshot, currently raw media
+    ctx.drawImage(source, 0, 0, width, height);
+    return canvas.toDataURL('image/jpeg', 0.7);
+  };
+
+  // Expose method to capture frame for AI analysis and thumbnails.
+  // The default width suits AI frame context; callers that only need a small
+  // preview (e.g. project thumbnails) can pass a tighter limit to cut encode
+  // time and payload size.
   useImperativeHandle(ref, () => ({
-    getSnapshot: () => {
-      const MAX_WIDTH = 640; // Limit width to prevent massive database payloads
-
-      // Handle Video Snapshot
-      if (type === 'video' && videoRef.current) {
-          try {
-            const video = videoRef.current;
-            const originalWidth = video.videoWidth || 640;
-            const originalHeight = video.videoHeight || 360;
-            
-            // Calculate aspect ratio preserving dimensions
-            const scale = Math.min(1, MAX_WIDTH / originalWidth);
-            const width = originalWidth * scale;
-            const height = originalHeight * scale;
-
-            const canvas = document.createElement('canvas');
-            canvas.width = width;
-            canvas.height = height;
-            
-            const ctx = canvas.getContext('2d');
-            if (ctx) {
-              // Apply filters if needed for WYSIWYG snapshot, currently raw video
-              ctx.drawImage(video, 0, 0, width, height);
-              return canvas.toDataURL('image/jpeg', 0.7);
-            }
-          } catch (e) {
-              console.error("Failed to capture snapshot:", e);
+    getSnapshot: (maxWidth: number = 640) => {
+      try {
+        if (type === 'video' && videoRef.current) {
+          const video = videoRef.current;
+          const key = `${src}@${video.currentTime}@${maxWidth}`;
+          if (snapshotCache.current?.key === key) {
+            return snapshotCache.current.dataUrl;
           }
-      } 
-      // Handle Image Snapshot
-      else if (type === 'image' && imgRef.current) {
-          try {
-            const img = imgRef.current;
-            const originalWidth = img.naturalWidth || 640;
-            const originalHeight = img.naturalHeight || 360;
-
-            const scale = Math.min(1, MAX_WIDTH / originalWidth);
-            const width = originalWidth * scale;
-            const height = originalHeight * scale;
-
-            const canvas = document.createElement('canvas');
-            canvas.width = width;
-            canvas.height = height;
-
-            const ctx = canvas.getContext('2d');
-            if (ctx) {
-              ctx.drawImage(img, 0, 0, width, height);
-              return canvas.toDataURL('image/jpeg', 0.7);
-            }
-          } catch (e) {
-               console.error("Failed to capture image snapshot:", e);
+          const dataUrl = captureElement(video, video.videoWidth || 640, video.videoHeight || 360, maxWidth);
+          snapshotCache.current = { key, dataUrl };
+          return dataUrl;
+        }
+        if (type === 'image' && imgRef.current) {
+          const img = imgRef.current;
+          const key = `${src}@${maxWidth}`;
+          if (snapshotCache.current?.key === key) {
+            return snapshotCache.current.dataUrl;
           }
+          const dataUrl = captureElement(img, img.naturalWidth || 640, img.naturalHeight || 360, maxWidth);
+          snapshotCache.current = { key, dataUrl };
+          return dataUrl;
+        }
+      } catch (e) {
+        console.error("Failed to capture snapshot:", e);
       }
       return null;
     }
@@ -149,34 +169,27 @@ const VideoPlayer = forwardRef<VideoPlayerRef, VideoPlayerProps>(({
     }
   }, [videoState.volume]);
 
-  // Construct Filter String
-  const getFilterString = () => {
+  // Construct Filter String — rebuilt only when the fields it reads change,
+  // not on every render (the playback tick re-renders 10×/s).
+  const filterString = useMemo(() => {
     let filters = [];
-    
-    // Standard Presets
-    const presets = ['grayscale', 'sepia', 'vintage', 'cyberpunk', 'warm', 'none'];
-    
-    if (presets.includes(videoState.filter)) {
-      switch (videoState.filter) {
-        case 'grayscale': filters.push('grayscale(100%)'); break;
-        case 'sepia': filters.push('sepia(100%)'); break;
-        case 'vintage': filters.push('sepia(50%) contrast(120%) brightness(90%)'); break;
-        case 'cyberpunk': filters.push('hue-rotate(180deg) saturate(200%) contrast(110%)'); break;
-        case 'warm': filters.push('sepia(30%) saturate(140%) hue-rotate(-10deg)'); break;
-        default: break;
-      }
-    } else {
+
+    const preset = PRESET_FILTERS[videoState.filter];
+
+    if (preset === undefined) {
       // Custom AI Filter
       filters.push(videoState.filter);
+    } else if (preset) {
+      filters.push(preset);
     }
-    
+
     // Global Adjustments
     filters.push(`brightness(${videoState.brightness}%)`);
     filters.push(`contrast(${videoState.contrast}%)`);
     filters.push(`saturate(${videoState.saturation}%)`);
-    
+
     return filters.join(' ');
-  };
+  }, [videoState.filter, videoState.brightness, videoState.contrast, videoState.saturation]);
 
   // Calculate Opacity for Transitions
   const getOpacity = () => {
@@ -245,7 +258,7 @@ const VideoPlayer = forwardRef<VideoPlayerRef, VideoPlayerProps>(({
   }
 
   const commonStyles = {
-    filter: getFilterString(),
+    filter: filterString,
     opacity: getOpacity()
   };
 
@@ -4,34 +4,42 @@ import { Project, VideoState, TimelineClip, ChatMessage } from "../types";
 
 const PROJECTS_COLLECTION = "projects";
 
-export const createProject = async (userId: string, name: string): Promise<string> => {
-  const initialProject: Partial<Project> = {
+// Defaults for a newly created project, built once at module load.
+// Spread-copied per call so documents never share mutable references.
+const INITIAL_VIDEO_STATE: VideoState = {
+    isPlaying: false,
+    currentTime: 0,
+    duration: 0,
+    volume: 1,
+    playbackRate: 1,
+    filter: 'none',
+    brightness: 100,
+    contrast: 100,
+    saturation: 100,
+    fadeIn: 0,
+    fadeOut: 0
+};
+
+const WELCOME_MESSAGE: ChatMessage = {
+    id: 'welcome',
+    role: 'model',
+    text: "Hello! I'm Lumina. Upload a video and I can help you edit it."
+};
+
+export const createProject = async (userId: string, name: string): Promise<Project> => {
+  const initialProject: Omit<Project, 'id'> = {
     userId,
     name,
     lastModified: Date.now(),
-    videoState: {
-        isPlaying: false,
-        currentTime: 0,
-        duration: 0,
-        volume: 1,
-        playbackRate: 1,
-        filter: 'none',
-        brightness: 100,
-        contrast: 100,
-        saturation: 100,
-        fadeIn: 0,
-        fadeOut: 0
-    },
+    videoState: { ...INITIAL_VIDEO_STATE },
     clips: [],
-    messages: [{
-        id: 'welcome',
-        role: 'model',
-        text: "Hello! I'm Lumina. Upload a video and I can help you edit it."
-    }]
+    messages: [{ ...WELCOME_MESSAGE }]
   };
-  
+
   const docRef = await addDoc(collection(db, PROJECTS_COLLECTION), initialProject);
-  return docRef.id;
+  // Return the full document so callers can update their lists locally
+  // instead of re-querying the whole collection.
+  return { id: docRef.id, ...initialProject };
 };
 
 export const getUserProjects = async (userId: string): Promise<Project[]> => {
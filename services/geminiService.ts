@@ -9,6 +9,12 @@ if (!apiKey) {
 }
 const ai = new GoogleGenAI({ apiKey: apiKey || "" });
 
+// Models to try in order. If the preferred model is rate-limited or down we
+// fall back, and remember what worked so the next call tries it first instead
+// of paying the failed round-trip again.
+const GEMINI_MODELS = ["gemini-2.5-flash", "gemini-2.5-flash-lite"];
+let lastGoodModel: string | null = null;
+
 const SYSTEM_INSTRUCTION = `
 You are Lumina AI, an expert video editing assistant. Your goal is to help users edit videos by interpreting their natural language requests into structured commands.
 
@@ -59,17 +65,89 @@ const RESPONSE_SCHEMA: Schema = {
   required: ['action', 'reply']
 };
 
+// The request configuration is identical for every command — build the
+// system-prompt + schema skeleton once instead of per call.
+const GENERATION_CONFIG = {
+  systemInstruction: SYSTEM_INSTRUCTION,
+  responseMimeType: "application/json",
+  responseSchema: RESPONSE_SCHEMA,
+  // Editing commands are short, schema-bound and latency-sensitive; skip the
+  // flash models' thinking phase instead of paying for reasoning tokens.
+  thinkingConfig: { thinkingBudget: 0 }
+};
+
+// Mirrors the action enum in RESPONSE_SCHEMA; built once at module load so
+// per-response validation is a set probe.
+const VALID_ACTIONS: ReadonlySet<string> = new Set([
+  'set_speed', 'set_volume', 'apply_filter', 'set_custom_filter',
+  'set_transition', 'trim', 'analyze_mood', 'unknown'
+]);
+
+// Parse and validate the model output. responseSchema constrains the model,
+// but a truncated or malformed reply should degrade to the canned error
+// response instead of leaking an untyped object into the editor.
+const parseEngineResponse = (text: string): AIEngineResponse => {
+  // Despite the JSON response MIME type, models occasionally wrap output in
+  // markdown fences. Strip them with plain string ops — no regex needed, and
+  // the common clean case costs a single startsWith check.
+  let clean = text.trim();
+  if (clean.startsWith("```")) {
+    const nl = clean.indexOf("\n");
+    clean = nl !== -1 ? clean.slice(nl + 1) : clean.slice(3);
+    if (clean.endsWith("```")) {
+      clean = clean.slice(0, -3);
+    }
+    clean = clean.trim();
+  }
+
+  const raw = JSON.parse(clean);
+  if (
+    typeof raw !== 'object' || raw === null ||
+    typeof raw.action !== 'string' ||
+    typeof raw.reply !== 'string'
+  ) {
+    throw new Error("Malformed AI response");
+  }
+  // Coerce any action outside the schema enum to 'unknown' rather than
+  // letting the editor switch on an unexpected string.
+  if (!VALID_ACTIONS.has(raw.action)) {
+    raw.action = 'unknown';
+  }
+  return raw as AIEngineResponse;
+};
+
+// Identical text-only prompts (a user re-clicking a suggestion or retrying)
+// are answered from a small in-memory cache instead of re-hitting the API.
+// Prompts with a frame attached are never cached — the frame changes the answer.
+const RESPONSE_CACHE_LIMIT = 32;
+const responseCache = new Map<string, AIEngineResponse>();
+
+// Canned failure reply; frozen so the shared instance can't be mutated by a
+// caller and rebuilt per error.
+const FALLBACK_RESPONSE: AIEngineResponse = Object.freeze({
+  action: 'unknown' as const,
+  reply: "I'm having trouble connecting to the AI brain right now. Please try again."
+});
+
 export const processUserCommand = async (
-  prompt: string, 
+  prompt: string,
   currentFrameBase64?: string
 ): Promise<AIEngineResponse> => {
+  if (!currentFrameBase64) {
+    const cached = responseCache.get(prompt);
+    if (cached) return cached;
+  }
+
   try {
     const parts: any[] = [{ text: prompt }];
 
     // If we have a frame, attach it for multimodal analysis
     if (currentFrameBase64) {
-      // Remove header if present (data:image/jpeg;base64,)
-      const cleanBase64 = currentFrameBase64.split(',')[1] || currentFrameBase64;
+      // Remove header if present (data:image/jpeg;base64,) — slice past the
+      // comma instead of split(), which copies the payload into a throwaway
+      // array alongside the header string.
+      const comma = currentFrameBase64.indexOf(',');
+      const cleanBase64 = comma !== -1 ? currentFrameBase64.slice(comma + 1) : currentFrameBase64;
       parts.unshift({
         inlineData: {
           mimeType: 'image/jpeg',
@@ -78,30 +156,50 @@ export const processUserCommand = async (
       });
     }
 
-    const response = await ai.models.generateContent({
-      model: "gemini-2.5-flash",
-      contents: {
-        role: 'user',
-        parts: parts
-      },
-      config: {
-        systemInstruction: SYSTEM_INSTRUCTION,
-        responseMimeType: "application/json",
-        responseSchema: RESPONSE_SCHEMA
+    const models = lastGoodModel
+      ? [lastGoodModel, ...GEMINI_MODELS.filter(m => m !== lastGoodModel)]
+      : GEMINI_MODELS;
+
+    let response = null;
+    let lastError: unknown = null;
+
+    for (const model of models) {
+      try {
+        response = await ai.models.generateContent({
+          model,
+          contents: {
+            role: 'user',
+            parts: parts
+          },
+          config: GENERATION_CONFIG
+        });
+        lastGoodModel = model;
+        break;
+      } catch (err) {
+        console.warn(`Gemini model ${model} failed, trying next fallback`, err);
+        lastError = err;
       }
-    });
+    }
+
+    if (!response) throw lastError ?? new Error("All Gemini models failed");
 
     const text = response.text;
     if (!text) throw new Error("No response from AI");
 
-    const parsed: AIEngineResponse = JSON.parse(text);
+    const parsed = parseEngineResponse(text);
+
+    if (!currentFrameBase64) {
+      // Map preserves insertion order, so evicting the first key is FIFO.
+      if (responseCache.size >= RESPONSE_CACHE_LIMIT) {
+        responseCache.delete(responseCache.keys().next().value as string);
+      }
+      responseCache.set(prompt, parsed);
+    }
+
     return parsed;
 
   } catch (error) {
     console.error("Gemini API Error:", error);
-    return {
-      action: 'unknown',
-      reply: "I'm having trouble connecting to the AI brain right now. Please try again."
-    };
+    return FALLBACK_RESPONSE;
   }
 };
\ No newline at end of file
@@ -3,11 +3,29 @@ const DB_NAME = 'LuminaLocalStore';
 const STORE_NAME = 'projectMedia';
 const DB_VERSION = 1;
 
+// Cache the connection so every operation reuses one open database handle
+// instead of paying the open/upgrade round-trip per call.
+let dbPromise: Promise<IDBDatabase> | null = null;
+
 const openDB = (): Promise<IDBDatabase> => {
-  return new Promise((resolve, reject) => {
+  if (dbPromise) return dbPromise;
+
+  dbPromise = new Promise((resolve, reject) => {
     const request = indexedDB.open(DB_NAME, DB_VERSION);
-    request.onerror = () => reject(request.error);
-    request.onsuccess = () => resolve(request.result);
+    request.onerror = () => {
+      dbPromise = null; // Allow a retry on the next call
+      reject(request.error);
+    };
+    request.onsuccess = () => {
+      const db = request.result;
+      // If another tab upgrades the schema, drop the cached handle so the
+      // next operation reopens cleanly.
+      db.onversionchange = () => {
+        db.close();
+        dbPromise = null;
+      };
+      resolve(db);
+    };
     request.onupgradeneeded = (event) => {
       const db = (event.target as IDBOpenDBRequest).result;
       if (!db.objectStoreNames.contains(STORE_NAME)) {
@@ -15,8 +33,14 @@ const openDB = (): Promise<IDBDatabase> => {
       }
     };
   });
+  return dbPromise;
 };
 
+// Warm the connection at module load so the first media save/restore doesn't
+// pay the open (and possible schema-upgrade) latency. An open failure here is
+// swallowed; the first real operation retries and surfaces the error.
+openDB().catch(() => {});
+
 export const saveFileToLocal = async (key: string, file: File): Promise<void> => {
   const db = await openDB();
   return new Promise((resolve, reject) => {